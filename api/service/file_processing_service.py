@@ -3,6 +3,7 @@ import uuid
 from datetime import datetime
 from typing import Dict, Optional
 from utils.logger import BaseLogging
+from api.service.record_store import ShardedRecordStore
 
 class FileProcessingService(BaseLogging):
     """
@@ -14,7 +15,7 @@ class FileProcessingService(BaseLogging):
         super().__init__()  # Auto-logs initialization
         
         # Service data
-        self.file_records = {}
+        self.file_records = ShardedRecordStore()
         self.allowed_extensions = {'txt', 'csv'}
     
     def get_allowed_extensions(self) -> set:
@@ -142,7 +143,7 @@ class FileProcessingService(BaseLogging):
                 'timestamp': datetime.now().isoformat()
             }
             
-            self.file_records[record_id] = record
+            self.file_records.put(record_id, record)
             self.log_info(f"Saved record: {record_id} for file: {filename}")  
             return record_id
             
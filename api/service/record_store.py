@@ -0,0 +1,180 @@
+# api/service/record_store.py
+import threading
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from utils.logger import BaseLogging
+
+
+class _Shard:
+    """A single independently locked segment of the record store."""
+
+    __slots__ = ('lock', 'records', 'indexes')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records: Dict[str, Dict] = {}
+        self.indexes: Dict[str, Dict[Any, set]] = {}
+
+
+class ShardedRecordStore(BaseLogging):
+    """
+    Thread-safe in-memory record store.
+    Records are sharded by record ID hash across independently locked
+    segments, so writers to different shards never wait on each other.
+    """
+
+    def __init__(self, shard_count: int = 16):
+        super().__init__()  # Auto-logs initialization
+
+        if shard_count < 1:
+            raise ValueError("Shard count must be at least 1")
+
+        self._shards = [_Shard() for _ in range(shard_count)]
+        self._index_keys: Dict[str, Callable[[Dict], Any]] = {}
+        self._index_lock = threading.Lock()
+
+    @property
+    def shard_count(self) -> int:
+        """Get the number of shards."""
+        return len(self._shards)
+
+    def _shard_for(self, record_id: str) -> _Shard:
+        return self._shards[hash(record_id) % len(self._shards)]
+
+    def add_index(self, name: str, key_func: Callable[[Dict], Any]) -> None:
+        """
+        Register a secondary index and build it from the existing records.
+
+        Args:
+            name: The name of the index
+            key_func: Function returning the index key for a record
+
+        Raises:
+            ValueError: If an index with the same name already exists
+        """
+        with self._index_lock:
+            if name in self._index_keys:
+                raise ValueError(f"Index already exists: {name}")
+
+            # All shards are locked so no insert can miss the new index
+            with self._lock_all():
+                # Build into local dicts so a failing key_func registers nothing
+                built = []
+                for shard in self._shards:
+                    index: Dict[Any, set] = {}
+                    for record_id, record in shard.records.items():
+                        index.setdefault(key_func(record), set()).add(record_id)
+                    built.append(index)
+
+                for shard, index in zip(self._shards, built):
+                    shard.indexes[name] = index
+                self._index_keys[name] = key_func
+
+        self.log_info(f"Index added: {name}")
+
+    def put(self, record_id: str, record: Dict) -> None:
+        """
+        Insert or replace a record and update every secondary index atomically.
+
+        Args:
+            record_id: The ID of the record
+            record: The record data
+        """
+        if not record_id:
+            raise ValueError("Record id is empty")
+
+        shard = self._shard_for(record_id)
+        with shard.lock:
+            previous = shard.records.get(record_id)
+
+            # Compute every key first so a failing key_func leaves the shard unchanged
+            changes = []
+            for name, key_func in self._index_keys.items():
+                old_key = key_func(previous) if previous is not None else None
+                new_key = key_func(record)
+                hash(new_key)  # Unhashable keys must fail before any index is touched
+                changes.append((shard.indexes[name], previous is not None, old_key, new_key))
+
+            for index, had_previous, old_key, new_key in changes:
+                if had_previous:
+                    self._unindex(index, old_key, record_id)
+                index.setdefault(new_key, set()).add(record_id)
+            shard.records[record_id] = record
+
+    def get(self, record_id: str, default: Optional[Dict] = None) -> Optional[Dict]:
+        """Retrieve a record by its ID, or default if not found."""
+        shard = self._shard_for(record_id)
+        with shard.lock:
+            return shard.records.get(record_id, default)
+
+    def remove(self, record_id: str) -> Optional[Dict]:
+        """
+        Remove a record and its index entries.
+
+        Returns:
+            The removed record or None if not found
+        """
+        shard = self._shard_for(record_id)
+        with shard.lock:
+            record = shard.records.pop(record_id, None)
+            if record is not None:
+                for name, key_func in self._index_keys.items():
+                    self._unindex(shard.indexes[name], key_func(record), record_id)
+            return record
+
+    def find_by_index(self, name: str, key: Any) -> List[Dict]:
+        """
+        Retrieve all records whose index key matches.
+
+        Args:
+            name: The name of the index
+            key: The index key to look up
+
+        Raises:
+            KeyError: If the index does not exist
+        """
+        if name not in self._index_keys:
+            raise KeyError(f"Index not found: {name}")
+
+        matches = []
+        for shard in self._shards:
+            with shard.lock:
+                for record_id in shard.indexes[name].get(key, ()):
+                    matches.append(shard.records[record_id])
+        return matches
+
+    def snapshot(self) -> List[Tuple[str, Dict]]:
+        """
+        Take a consistent point-in-time copy of all records.
+        Every shard is locked while copying, so the result reflects a
+        single moment across the whole store.
+        """
+        with self._lock_all():
+            return [item for shard in self._shards for item in shard.records.items()]
+
+    def _lock_all(self) -> ExitStack:
+        # Locks are always taken in shard order to avoid deadlocks
+        stack = ExitStack()
+        for shard in self._shards:
+            stack.enter_context(shard.lock)
+        return stack
+
+    @staticmethod
+    def _unindex(index: Dict[Any, set], key: Any, record_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(record_id)
+            if not ids:
+                del index[key]
+
+    def __contains__(self, record_id: str) -> bool:
+        shard = self._shard_for(record_id)
+        with shard.lock:
+            return record_id in shard.records
+
+    def __len__(self) -> int:
+        with self._lock_all():
+            return sum(len(shard.records) for shard in self._shards)
+
+    def __iter__(self) -> Iterator[Tuple[str, Dict]]:
+        return iter(self.snapshot())
@@ -0,0 +1,51 @@
+# benchmark_record_store.py
+# Measures record store write throughput as the number of writer threads grows.
+# Writes only scale past one thread on free-threaded (no-GIL) Python builds.
+import sys
+import threading
+import time
+from api.service.record_store import ShardedRecordStore
+
+WRITES_PER_THREAD = 50000
+THREAD_COUNTS = [1, 2, 4, 8]
+
+
+def run(thread_count, shard_count):
+    store = ShardedRecordStore(shard_count=shard_count)
+    store.add_index('filename', lambda record: record['filename'])
+    barrier = threading.Barrier(thread_count + 1)
+
+    def writer(thread_id):
+        barrier.wait()
+        for i in range(WRITES_PER_THREAD):
+            record_id = f"{thread_id}-{i}"
+            store.put(record_id, {'id': record_id, 'filename': f"file_{i % 100}.txt"})
+
+    threads = [threading.Thread(target=writer, args=(t,)) for t in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return thread_count * WRITES_PER_THREAD / elapsed
+
+
+if __name__ == '__main__':
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
+
+    results = {}
+    for shard_count in (1, 16):
+        print(f"\nshards={shard_count}")
+        for thread_count in THREAD_COUNTS:
+            ops = run(thread_count, shard_count)
+            results[(shard_count, thread_count)] = ops
+            speedup = ops / results[(shard_count, 1)]
+            print(f"  threads={thread_count}: {ops:,.0f} writes/sec ({speedup:.2f}x vs 1 thread)")
+
+    print("\nshards=16 vs shards=1")
+    for thread_count in THREAD_COUNTS:
+        ratio = results[(16, thread_count)] / results[(1, thread_count)]
+        print(f"  threads={thread_count}: {ratio:.2f}x")
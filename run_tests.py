@@ -7,6 +7,7 @@ from utils.logger import BaseLogging
 # Importing test cases
 from tests.unit.test_file_processing_service import TestFileProcessingService
 from tests.unit.test_file_upload_controller import TestFileUploadController
+from tests.unit.test_record_store import TestShardedRecordStore
 from tests.integration.test_file_processor_app import TestFileProcessorApp
 
 def run_tests():
@@ -25,6 +26,7 @@ def run_tests():
     unit_test_suite = unittest.TestSuite()
     unit_test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestFileProcessingService))
     unit_test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestFileUploadController))
+    unit_test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestShardedRecordStore))
 
     integration_test_suite = unittest.TestSuite()
     integration_test_suite.addTest(unittest.TestLoader().loadTestsFromTestCase(TestFileProcessorApp))
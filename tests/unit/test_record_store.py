@@ -0,0 +1,138 @@
+# tests/unit/test_record_store.py
+import threading
+import unittest
+from api.service.record_store import ShardedRecordStore
+
+class TestShardedRecordStore(unittest.TestCase):
+    
+    def setUp(self):
+        self.store = ShardedRecordStore(shard_count=4)
+    
+    def test_put_and_get(self):
+        """Testing a stored record can be retrieved by ID."""
+        self.store.put('1', {'id': '1', 'filename': 'a.txt'})
+        
+        self.assertEqual(self.store.get('1')['filename'], 'a.txt')
+        self.assertIn('1', self.store)
+        self.assertIsNone(self.store.get('missing'))
+    
+    def test_index_updated_on_insert_replace_and_remove(self):
+        """Testing secondary index follows inserts, replacements and removals."""
+        self.store.put('1', {'id': '1', 'filename': 'a.txt'})
+        self.store.add_index('filename', lambda record: record['filename'])
+        self.store.put('2', {'id': '2', 'filename': 'a.txt'})
+        self.assertEqual(len(self.store.find_by_index('filename', 'a.txt')), 2)
+        
+        self.store.put('2', {'id': '2', 'filename': 'b.txt'})
+        self.assertEqual(len(self.store.find_by_index('filename', 'a.txt')), 1)
+        
+        self.store.remove('1')
+        self.assertEqual(self.store.find_by_index('filename', 'a.txt'), [])
+        self.assertEqual(self.store.find_by_index('filename', 'b.txt')[0]['id'], '2')
+    
+    def test_invalid_arguments(self):
+        """Testing invalid shard count, duplicate index and unknown index are rejected."""
+        with self.assertRaises(ValueError):
+            ShardedRecordStore(shard_count=0)
+        
+        self.store.add_index('filename', lambda record: record['filename'])
+        with self.assertRaises(ValueError):
+            self.store.add_index('filename', lambda record: record['filename'])
+        with self.assertRaises(KeyError):
+            self.store.find_by_index('missing', 'a.txt')
+    
+    def test_failed_put_leaves_store_unchanged(self):
+        """Testing a key function error during put rolls back every index."""
+        self.store.add_index('filename', lambda record: record['filename'])
+        self.store.add_index('word_count', lambda record: record['word_count'])
+        self.store.put('1', {'id': '1', 'filename': 'a.txt', 'word_count': 1})
+        
+        with self.assertRaises(KeyError):
+            self.store.put('1', {'id': '1', 'filename': 'b.txt'})
+        
+        self.assertEqual(self.store.get('1')['filename'], 'a.txt')
+        self.assertEqual(len(self.store.find_by_index('filename', 'a.txt')), 1)
+        self.assertEqual(len(self.store.find_by_index('word_count', 1)), 1)
+        self.assertEqual(self.store.find_by_index('filename', 'b.txt'), [])
+    
+    def test_failed_add_index_registers_nothing(self):
+        """Testing a key function error during add_index leaves no partial index."""
+        self.store.put('1', {'id': '1', 'filename': 'a.txt'})
+        self.store.put('2', {'id': '2'})
+        
+        with self.assertRaises(KeyError):
+            self.store.add_index('filename', lambda record: record['filename'])
+        with self.assertRaises(KeyError):
+            self.store.find_by_index('filename', 'a.txt')
+        
+        # The same name can be registered again with a fixed key function
+        self.store.add_index('filename', lambda record: record.get('filename'))
+        self.assertEqual(len(self.store.find_by_index('filename', 'a.txt')), 1)
+        self.store.put('3', {'id': '3', 'filename': 'a.txt'})
+        self.assertEqual(len(self.store.find_by_index('filename', 'a.txt')), 2)
+    
+    def test_snapshot_and_index_consistent_during_writes(self):
+        """Testing snapshots and index lookups stay consistent while writers run."""
+        self.store.add_index('filename', lambda record: record['filename'])
+        for i in range(50):
+            self.store.put(f"moving-{i}", {'id': f"moving-{i}", 'filename': 'a.txt'})
+        
+        stop = threading.Event()
+        
+        def mover():
+            # Moves records between index keys without changing the record count
+            n = 0
+            while not stop.is_set():
+                record_id = f"moving-{n % 50}"
+                filename = 'b.txt' if n % 2 else 'a.txt'
+                self.store.put(record_id, {'id': record_id, 'filename': filename})
+                n += 1
+        
+        def appender():
+            # Inserts records in sequence, spread across every shard
+            for i in range(2000):
+                self.store.put(f"seq-{i}", {'id': f"seq-{i}", 'seq': i, 'filename': 'seq'})
+            stop.set()
+        
+        threads = [threading.Thread(target=mover) for _ in range(3)]
+        threads.append(threading.Thread(target=appender))
+        for thread in threads:
+            thread.start()
+        
+        try:
+            while not stop.is_set():
+                snapshot = self.store.snapshot()
+                
+                moving = [record for record_id, record in snapshot if record_id.startswith('moving-')]
+                self.assertEqual(len(moving), 50)
+                
+                # A point-in-time copy holds every earlier insert of the appender
+                seqs = sorted(record['seq'] for _, record in snapshot if 'seq' in record)
+                self.assertEqual(seqs, list(range(len(seqs))))
+                
+                for key in ('a.txt', 'b.txt'):
+                    for record in self.store.find_by_index('filename', key):
+                        self.assertEqual(record['filename'], key)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+    
+    def test_concurrent_writes(self):
+        """Testing no writes are lost when many threads insert at once."""
+        def writer(thread_id):
+            for i in range(500):
+                record_id = f"{thread_id}-{i}"
+                self.store.put(record_id, {'id': record_id})
+        
+        threads = [threading.Thread(target=writer, args=(t,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(self.store), 8 * 500)
+        self.assertEqual(len(self.store.snapshot()), 8 * 500)
+
+if __name__ == '__main__':
+    unittest.main()